@@ -1,5 +1,5 @@
 # Copyright 2019-present Kensho Technologies, LLC.
-from itertools import chain
+from weakref import WeakKeyDictionary
 
 from graphql.type import GraphQLSchema
 
@@ -40,8 +40,24 @@ DIRECTIVES_ALLOWED_IN_MACRO_EDGE_DEFINITION = frozenset(
 )
 
 
+# Cache of macro edge definition schemas, keyed on the querying schema they were derived from.
+# Constructing the definition schema copies all of the querying schema's type map and directives,
+# which is wasteful to repeat for every macro being validated. The weak reference ensures that
+# cached definition schemas do not outlive their querying schemas.
+_macro_edge_schema_cache = WeakKeyDictionary()
+
+
 def get_schema_for_macro_edge_definitions(querying_schema):
     """Given a schema object used for querying, create a schema used for macro edge definitions."""
+    macro_edge_schema = _macro_edge_schema_cache.get(querying_schema, None)
+    if macro_edge_schema is None:
+        macro_edge_schema = _make_schema_for_macro_edge_definitions(querying_schema)
+        _macro_edge_schema_cache[querying_schema] = macro_edge_schema
+    return macro_edge_schema
+
+
+def _make_schema_for_macro_edge_definitions(querying_schema):
+    """Create a schema used for macro edge definitions, without any caching."""
     original_directives = querying_schema.directives
     check_for_nondefault_directive_names(original_directives)
 
@@ -52,7 +68,7 @@ def get_schema_for_macro_edge_definitions(querying_schema):
 
     new_directives = [
         directive
-        for directive in chain(original_directives, directives_required_in_macro_edge_definition)
+        for directive in [*original_directives, *directives_required_in_macro_edge_definition]
         if directive.name in DIRECTIVES_ALLOWED_IN_MACRO_EDGE_DEFINITION
     ]
 
@@ -1,6 +1,8 @@
 # Copyright 2019-present Kensho Technologies, LLC.
 from copy import copy
+from weakref import WeakKeyDictionary
 
+from graphql import print_ast
 from graphql.language.ast import (
     ArgumentNode,
     DirectiveNode,
@@ -53,11 +55,25 @@ def _validate_query_definition(ast):
         )
 
 
+# Cache of validation results, keyed on the schema against which validation was performed, then
+# on the printed form of the AST that was validated. Validation is deterministic given the schema
+# and the AST, and macro edges are frequently re-registered with identical definitions (e.g. when
+# reloading macro registries), so memoizing the validation result avoids redundant validator
+# passes over the AST. Keying on the schema with a weak reference ensures the cache does not
+# prolong the lifetime of schemas that are no longer in use.
+_macro_edge_validation_results = WeakKeyDictionary()
+
+
 def _validate_ast_with_builtin_graphql_validation(schema, ast):
     """Validate the ast against the schema with macro directives using GraphQL validate function."""
-    schema_with_macro_edge_directives = get_schema_for_macro_edge_definitions(schema)
+    results_for_schema = _macro_edge_validation_results.setdefault(schema, {})
+    cache_key = print_ast(ast)
+    validation_errors = results_for_schema.get(cache_key, None)
+    if validation_errors is None:
+        schema_with_macro_edge_directives = get_schema_for_macro_edge_definitions(schema)
+        validation_errors = validate(schema_with_macro_edge_directives, ast)
+        results_for_schema[cache_key] = validation_errors
 
-    validation_errors = validate(schema_with_macro_edge_directives, ast)
     if validation_errors:
         raise GraphQLInvalidMacroError(
             u"Macro edge failed validation: {}".format(validation_errors)
@@ -12,6 +12,46 @@ from .query_parameterizer import generate_parameterized_queries
 from .typedefs import PageAndRemainder
 
 
+# Name of the attribute under which cached QueryPlanningAnalysis objects are stored on the
+# QueryPlanningSchemaInfo they were computed for. Query analysis performs schema lookups and
+# cardinality estimation that are deterministic in the query, and callers frequently re-paginate
+# the same query (e.g. at several page sizes), so memoizing the analysis avoids repaying that
+# cost. The cache lives on the schema_info itself because each analysis strongly references its
+# schema_info: a module-level cache keyed on the schema_info would keep every schema_info it has
+# ever seen (and all of its cached analyses) alive indefinitely, while an attribute dies together
+# with the object it memoizes for.
+_QUERY_ANALYSIS_CACHE_ATTRIBUTE = "_query_analysis_cache"
+
+# Maximum number of analyses cached per schema_info, to bound memory use for callers that
+# paginate many distinct queries against the same schema.
+_QUERY_ANALYSIS_CACHE_MAX_SIZE = 128
+
+
+def _analyze_query_string_with_cache(
+    schema_info: QueryPlanningSchemaInfo, query: QueryStringWithParameters
+) -> QueryPlanningAnalysis:
+    """Return a possibly-cached QueryPlanningAnalysis for the given query."""
+    try:
+        cache_key = (query.query_string, tuple(sorted(query.parameters.items())))
+        hash(cache_key)
+    except TypeError:
+        # Unhashable parameter values cannot be used as a cache key; skip the cache entirely.
+        return analyze_query_string(schema_info, query)
+
+    analyses_for_schema = getattr(schema_info, _QUERY_ANALYSIS_CACHE_ATTRIBUTE, None)
+    if analyses_for_schema is None:
+        analyses_for_schema = {}
+        setattr(schema_info, _QUERY_ANALYSIS_CACHE_ATTRIBUTE, analyses_for_schema)
+
+    query_analysis = analyses_for_schema.get(cache_key, None)
+    if query_analysis is None:
+        query_analysis = analyze_query_string(schema_info, query)
+        if len(analyses_for_schema) >= _QUERY_ANALYSIS_CACHE_MAX_SIZE:
+            analyses_for_schema.clear()
+        analyses_for_schema[cache_key] = query_analysis
+    return query_analysis
+
+
 def _estimate_number_of_pages(query: ASTWithParameters, result_size: float, page_size: int) -> int:
     """Estimate how many pages of results we should generate to meet the desired result size.
 
@@ -38,12 +78,10 @@ def _estimate_number_of_pages(query: ASTWithParameters, result_size: float, page
         )
 
     # Since using a // b returns the fraction rounded down, we instead use (a + b - 1) // b, which
-    # returns the fraction value rounded up, which is the desired functionality.
-    num_pages = int((result_size + page_size - 1) // page_size)
-    if num_pages == 0:
-        num_pages = 1
-
-    return num_pages
+    # returns the fraction value rounded up, which is the desired functionality. The estimate is
+    # truncated to an int up front so the division stays in integer arithmetic throughout.
+    num_pages = (int(result_size) + page_size - 1) // page_size
+    return max(num_pages, 1)
 
 
 def paginate_query_ast(
@@ -143,13 +181,20 @@ def paginate_query(
             - Tuple of PaginationAdvisory objects that communicate what can be done to improve
               pagination
     """
-    query_analysis = analyze_query_string(schema_info, query)
+    query_analysis = _analyze_query_string_with_cache(schema_info, query)
     ast_page_and_remainder, advisories = paginate_query_ast(query_analysis, page_size)
 
-    page_query_with_parameters = QueryStringWithParameters(
-        print_ast(ast_page_and_remainder.one_page.query_ast),
-        ast_page_and_remainder.one_page.parameters,
-    )
+    one_page = ast_page_and_remainder.one_page
+    if one_page is query_analysis.ast_with_parameters:
+        # Pagination left the query unchanged, so reuse the original query string instead of
+        # re-printing the entire AST.
+        page_query_with_parameters = QueryStringWithParameters(
+            query.query_string, one_page.parameters
+        )
+    else:
+        page_query_with_parameters = QueryStringWithParameters(
+            print_ast(one_page.query_ast), one_page.parameters
+        )
     remainder_queries_with_parameters = tuple(
         QueryStringWithParameters(print_ast(query.query_ast), query.parameters)
         for query in ast_page_and_remainder.remainder
@@ -1,7 +1,6 @@
 # Copyright 2019-present Kensho Technologies, LLC.
-from copy import copy
 import logging
-from typing import Any, Dict, Set, Tuple, cast
+from typing import Any, Dict, List, Set, Tuple, cast
 
 from graphql import print_ast
 from graphql.language.ast import (
@@ -17,7 +16,7 @@ from graphql.language.ast import (
     StringValueNode,
 )
 
-from ..ast_manipulation import get_ast_field_name, get_only_query_definition
+from ..ast_manipulation import get_only_query_definition
 from ..compiler.helpers import get_parameter_name
 from ..cost_estimation.analysis import QueryPlanningAnalysis
 from ..cost_estimation.int_value_conversion import convert_field_value_to_int
@@ -43,9 +42,45 @@ def _generate_new_name(base_name: str, taken_names: Set[str]) -> str:
         a name based on the base_name that is not in taken_names
     """
     index = 0
-    while "{}_{}".format(base_name, index) in taken_names:
+    candidate = f"{base_name}_{index}"
+    while candidate in taken_names:
         index += 1
-    return "{}_{}".format(base_name, index)
+        candidate = f"{base_name}_{index}"
+    return candidate
+
+
+def _replace_selections(node_ast: DocumentNode, new_selections: List[DocumentNode]) -> DocumentNode:
+    """Return a node with the given selections, sharing all of the node's other attributes."""
+    new_selection_set = SelectionSetNode(selections=new_selections)
+    if isinstance(node_ast, FieldNode):
+        return FieldNode(
+            loc=node_ast.loc,
+            alias=node_ast.alias,
+            name=node_ast.name,
+            arguments=node_ast.arguments,
+            directives=node_ast.directives,
+            selection_set=new_selection_set,
+        )
+    elif isinstance(node_ast, InlineFragmentNode):
+        return InlineFragmentNode(
+            loc=node_ast.loc,
+            type_condition=node_ast.type_condition,
+            directives=node_ast.directives,
+            selection_set=new_selection_set,
+        )
+    elif isinstance(node_ast, OperationDefinitionNode):
+        return OperationDefinitionNode(
+            loc=node_ast.loc,
+            operation=node_ast.operation,
+            name=node_ast.name,
+            variable_definitions=node_ast.variable_definitions,
+            directives=node_ast.directives,
+            selection_set=new_selection_set,
+        )
+    else:
+        raise AssertionError(
+            f'Input AST is of type "{type(node_ast).__name__}", which should not be a selection.'
+        )
 
 
 def _get_binary_filter_node_parameter(filter_directive: DirectiveNode) -> str:
@@ -100,26 +135,15 @@ def _is_new_filter_stronger(
         raise AssertionError(f"Expected operation to be < or >=, got {operation}.")
 
 
-def _are_filter_operations_equal_and_possible_to_eliminate(
-    filter_operation_1: str, filter_operation_2: str
-) -> bool:
-    """Return True only if one of the filters is redundant."""
-    if filter_operation_1 == filter_operation_2 == "<":
-        return True
-    if filter_operation_1 == filter_operation_2 == ">=":
-        return True
-    return False
-
-
-def _add_pagination_filter_at_node(
+def _add_pagination_filters_at_node(
     query_analysis: QueryPlanningAnalysis,
     node_vertex_path: VertexPath,
     node_ast: DocumentNode,
     pagination_field: str,
-    directive_to_add: DirectiveNode,
+    directives_to_add: List[DirectiveNode],
     extended_parameters: Dict[str, Any],
-) -> Tuple[DocumentNode, Dict[str, Any]]:
-    """Add the filter to the target field, returning a query and its new parameters.
+) -> Tuple[List[DocumentNode], List[Dict[str, Any]]]:
+    """Add each filter to the target field, returning a query and its parameters per filter.
 
     Args:
         query_analysis: the entire query with any query analysis needed for pagination
@@ -127,49 +151,67 @@ def _add_pagination_filter_at_node(
         node_ast: part of the entire query, rooted at the location where we are
                   adding a filter.
         pagination_field: field on which we are adding a filter
-        directive_to_add: filter directive to add
+        directives_to_add: filter directives to add, one per query to produce
         extended_parameters: original parameters of the query along with
-                             the parameter used in directive_to_add
+                             the parameters used in directives_to_add
 
     Returns:
-        tuple (new_ast, removed_parameters)
-        new_ast: A query with the filter inserted, and any filters on the same location with
-                 the same operation removed.
-        new_parameters: The parameters to use with the new_ast
+        tuple (new_asts, new_parameters_list), with one entry per directive in
+        directives_to_add:
+        new_asts: Queries with the respective filter inserted, and any filters on the same
+                  location with the same operation removed. All unmodified selections are
+                  shared between the queries.
+        new_parameters_list: The parameters to use with each of the new_asts
     """
     if not isinstance(node_ast, (FieldNode, InlineFragmentNode, OperationDefinitionNode)):
         raise AssertionError(
             f'Input AST is of type "{type(node_ast).__name__}", which should not be a selection.'
         )
 
-    new_directive_operation = _get_filter_node_operation(directive_to_add)
-    new_directive_parameter_name = _get_binary_filter_node_parameter(directive_to_add)
-    new_directive_parameter_value = extended_parameters[new_directive_parameter_name]
-
-    # If the field exists, add the new filter and remove redundant filters.
-    new_parameters = dict(extended_parameters)
-    new_selections = []
-    found_field = False
-    for selection_ast in node_ast.selection_set.selections:
-        new_selection_ast = selection_ast
-        field_name = get_ast_field_name(selection_ast)
-        if field_name == pagination_field:
-            found_field = True
-            new_selection_ast = copy(selection_ast)
-            new_selection_ast.directives = copy(selection_ast.directives)
+    # Find the target field, scanning the selections only once for all directives being added.
+    # The selections list is never mutated, so no defensive copy is made here.
+    selections = node_ast.selection_set.selections
+    target_field_index = None
+    for index, selection_ast in enumerate(selections):
+        if selection_ast.name.value == pagination_field:
+            target_field_index = index
+            break
+
+    new_asts = []
+    new_parameters_list = []
+    for directive_to_add in directives_to_add:
+        new_directive_operation = _get_filter_node_operation(directive_to_add)
+        new_directive_parameter_name = _get_binary_filter_node_parameter(directive_to_add)
+        new_directive_parameter_value = extended_parameters[new_directive_parameter_name]
+
+        # Only existing filters with the same operation as the new filter may be eliminated, and
+        # only "<" and ">=" filters are possible to eliminate. Precompute this property of the new
+        # directive so the loop below only extracts each existing directive's operation once.
+        new_directive_operation_is_eliminatable = new_directive_operation in ("<", ">=")
+
+        removed_parameter_names: Set[str] = set()
+        if target_field_index is None:
+            # The field didn't exist, create it and add the new directive to it.
+            new_selections = [
+                FieldNode(name=NameNode(value=pagination_field), directives=[directive_to_add])
+            ]
+            new_selections.extend(selections)
+        else:
+            # The field exists, add the new filter and remove redundant filters.
+            selection_ast = selections[target_field_index]
 
             new_directives = []
             for directive in selection_ast.directives:
-                operation = _get_filter_node_operation(directive)
-                if _are_filter_operations_equal_and_possible_to_eliminate(
-                    new_directive_operation, operation
+                if (
+                    new_directive_operation_is_eliminatable
+                    and _get_filter_node_operation(directive) == new_directive_operation
                 ):
                     parameter_name = _get_binary_filter_node_parameter(directive)
-                    parameter_value = new_parameters[parameter_name]
+                    parameter_value = extended_parameters[parameter_name]
                     if not _is_new_filter_stronger(
                         query_analysis,
                         PropertyPath(node_vertex_path, pagination_field),
-                        operation,
+                        new_directive_operation,
                         new_directive_parameter_value,
                         parameter_value,
                     ):
@@ -188,93 +230,115 @@ def _add_pagination_filter_at_node(
                                 "query": query_analysis.query_string_with_parameters,
                             },
                         )
-                    del new_parameters[parameter_name]
+                    removed_parameter_names.add(parameter_name)
                 else:
                     new_directives.append(directive)
             new_directives.append(directive_to_add)
-            new_selection_ast.directives = new_directives
-        new_selections.append(new_selection_ast)
 
-    # If field didn't exist, create it and add the new directive to it.
-    if not found_field:
-        new_selections.insert(
-            0, FieldNode(name=NameNode(value=pagination_field), directives=[directive_to_add])
-        )
+            # Construct the replacement field directly rather than copying and mutating the
+            # original, sharing all of its unmodified attributes.
+            new_selection_ast = FieldNode(
+                loc=selection_ast.loc,
+                alias=selection_ast.alias,
+                name=selection_ast.name,
+                arguments=selection_ast.arguments,
+                directives=new_directives,
+                selection_set=selection_ast.selection_set,
+            )
+
+            new_selections = list(selections)
+            new_selections[target_field_index] = new_selection_ast
+
+        # Drop the parameters of all eliminated filters in a single pass with O(1) lookups.
+        if removed_parameter_names:
+            new_parameters = {
+                name: value
+                for name, value in extended_parameters.items()
+                if name not in removed_parameter_names
+            }
+        else:
+            new_parameters = dict(extended_parameters)
+
+        new_asts.append(_replace_selections(node_ast, new_selections))
+        new_parameters_list.append(new_parameters)
 
-    new_ast = copy(node_ast)
-    new_ast.selection_set = SelectionSetNode(selections=new_selections)
-    return new_ast, new_parameters
+    return new_asts, new_parameters_list
 
 
-def _add_pagination_filter_recursively(
+def _add_pagination_filters(
     query_analysis: QueryPlanningAnalysis,
-    node_ast: DocumentNode,
-    full_query_path: VertexPath,
+    query_root: DocumentNode,
     query_path: VertexPath,
     pagination_field: str,
-    directive_to_add: DirectiveNode,
+    directives_to_add: List[DirectiveNode],
     extended_parameters: Dict[str, Any],
-) -> Tuple[DocumentNode, Dict[str, Any]]:
-    """Add the filter to the target field, returning a query and its new parameters.
+) -> Tuple[List[DocumentNode], List[Dict[str, Any]]]:
+    """Add each filter to the target field, returning a query and its parameters per filter.
+
+    The AST spine down to the target field is traversed with a single iterative walk, no
+    matter how many filter directives are being added; the produced queries differ only in
+    the nodes on the path to the target field and share all other selections.
 
     Args:
         query_analysis: the entire query with any query analysis needed for pagination
-        node_ast: Part of the entire query, the location where we are adding a filter
-        full_query_path: path to the pagination vertex from the root
-        query_path: path to the pagination vertex from this node (node_ast)
+        query_root: the operation definition of the entire query
+        query_path: path to the pagination vertex from the root
         pagination_field: The field on which we are adding a filter
-        directive_to_add: The filter directive to add
+        directives_to_add: The filter directives to add, one per query to produce
         extended_parameters: The original parameters of the query along with
-                             the parameter used in directive_to_add
+                             the parameters used in directives_to_add
 
     Returns:
-        tuple (new_ast, removed_parameters)
-        new_ast: A query with the filter inserted, and any filters on the same location with
-                 the same operation removed.
-        new_parameters: The parameters to use with the new_ast
+        tuple (new_asts, new_parameters_list), with one entry per directive in
+        directives_to_add:
+        new_asts: Queries with the respective filter inserted, and any filters on the same
+                  location with the same operation removed.
+        new_parameters_list: The parameters to use with each of the new_asts
     """
-    if not isinstance(node_ast, (FieldNode, InlineFragmentNode, OperationDefinitionNode)):
-        raise AssertionError(
-            f'Input AST is of type "{type(node_ast).__name__}", which should not be a selection.'
-        )
+    # Walk down the spine of the AST along the query path, remembering each ancestor along
+    # with the position of the on-path child within the ancestor's selections.
+    ancestors = []
+    node_ast = query_root
+    for vertex_field_name in query_path:
+        if not isinstance(node_ast, (FieldNode, InlineFragmentNode, OperationDefinitionNode)):
+            raise AssertionError(
+                f'Input AST is of type "{type(node_ast).__name__}", '
+                f"which should not be a selection."
+            )
+        if node_ast.selection_set is None:
+            raise AssertionError(f"Invalid query path {query_path} {node_ast}.")
 
-    if len(query_path) == 0:
-        return _add_pagination_filter_at_node(
-            query_analysis,
-            full_query_path,
-            node_ast,
-            pagination_field,
-            directive_to_add,
-            extended_parameters,
-        )
+        selections = node_ast.selection_set.selections
+        for index, selection_ast in enumerate(selections):
+            # Inlined get_ast_field_name(), which is a hot attribute lookup in this walk.
+            if selection_ast.name.value == vertex_field_name:
+                break
+        else:
+            raise AssertionError(f"Invalid query path {query_path} {node_ast}.")
 
-    if node_ast.selection_set is None:
-        raise AssertionError(f"Invalid query path {query_path} {node_ast}.")
-
-    found_field = False
-    new_selections = []
-    for selection_ast in node_ast.selection_set.selections:
-        new_selection_ast = selection_ast
-        field_name = get_ast_field_name(selection_ast)
-        if field_name == query_path[0]:
-            found_field = True
-            new_selection_ast, new_parameters = _add_pagination_filter_recursively(
-                query_analysis,
-                selection_ast,
-                full_query_path,
-                query_path[1:],
-                pagination_field,
-                directive_to_add,
-                extended_parameters,
-            )
-        new_selections.append(new_selection_ast)
+        ancestors.append((node_ast, selections, index))
+        node_ast = selections[index]
+
+    new_asts, new_parameters_list = _add_pagination_filters_at_node(
+        query_analysis,
+        query_path,
+        node_ast,
+        pagination_field,
+        directives_to_add,
+        extended_parameters,
+    )
 
-    if not found_field:
-        raise AssertionError(f"Invalid query path {query_path} {node_ast}.")
+    # Rebuild the spine bottom-up: at each level, only the selections list containing the
+    # changed child is rebuilt, and all sibling selections are shared between the queries.
+    for node_ast, selections, index in reversed(ancestors):
+        rebuilt_asts = []
+        for new_child_ast in new_asts:
+            new_selections = list(selections)
+            new_selections[index] = new_child_ast
+            rebuilt_asts.append(_replace_selections(node_ast, new_selections))
+        new_asts = rebuilt_asts
 
-    new_ast = copy(node_ast)
-    new_ast.selection_set = SelectionSetNode(selections=new_selections)
-    return new_ast, new_parameters
+    return new_asts, new_parameters_list
 
 
 def _make_binary_filter_directive_node(op_name: str, param_name: str) -> DirectiveNode:
@@ -326,24 +390,20 @@ def generate_parameterized_queries(
     extended_parameters = dict(query.parameters)
     extended_parameters[param_name] = parameter_value
 
-    next_page_root, next_page_parameters = _add_pagination_filter_recursively(
+    # Share a single walk down the AST spine for both filters being inserted.
+    new_roots, new_parameters_list = _add_pagination_filters(
         query_analysis,
         query_root,
         vertex_partition.query_path,
-        vertex_partition.query_path,
         vertex_partition.pagination_field,
-        _make_binary_filter_directive_node("<", param_name),
-        extended_parameters,
-    )
-    remainder_root, remainder_parameters = _add_pagination_filter_recursively(
-        query_analysis,
-        query_root,
-        vertex_partition.query_path,
-        vertex_partition.query_path,
-        vertex_partition.pagination_field,
-        _make_binary_filter_directive_node(">=", param_name),
+        [
+            _make_binary_filter_directive_node("<", param_name),
+            _make_binary_filter_directive_node(">=", param_name),
+        ],
         extended_parameters,
     )
+    next_page_root, remainder_root = new_roots
+    next_page_parameters, remainder_parameters = new_parameters_list
 
     next_page = ASTWithParameters(DocumentNode(definitions=[next_page_root]), next_page_parameters)
     remainder = ASTWithParameters(DocumentNode(definitions=[remainder_root]), remainder_parameters)
@@ -262,13 +262,14 @@ OUTBOUND_EDGE_FIELD_PREFIX = "out_"
 INBOUND_EDGE_FIELD_PREFIX = "in_"
 VERTEX_FIELD_PREFIXES = frozenset({OUTBOUND_EDGE_FIELD_PREFIX, INBOUND_EDGE_FIELD_PREFIX})
 
+# str.startswith() accepts a tuple of prefixes, letting both prefixes be checked in one call.
+_VERTEX_FIELD_PREFIX_TUPLE = (OUTBOUND_EDGE_FIELD_PREFIX, INBOUND_EDGE_FIELD_PREFIX)
+
 
 def is_vertex_field_name(field_name):
     """Return True if the field's name indicates it is a non-root vertex field."""
     # N.B.: A vertex field is a field whose type is a vertex type. This is what edges are.
-    return field_name.startswith(OUTBOUND_EDGE_FIELD_PREFIX) or field_name.startswith(
-        INBOUND_EDGE_FIELD_PREFIX
-    )
+    return field_name.startswith(_VERTEX_FIELD_PREFIX_TUPLE)
 
 
 def _unused_function(*args, **kwargs):
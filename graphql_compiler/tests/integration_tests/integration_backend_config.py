@@ -1,7 +1,6 @@
 # Copyright 2018-present Kensho Technologies, LLC.
-from collections import namedtuple
-
 from six.moves.urllib.parse import quote_plus
+from sqlalchemy import create_engine
 
 from .. import test_backend
 
@@ -65,4 +64,22 @@ SQL_BACKEND_TO_CONNECTION_STRING = {
     #     u'sqlite:///:memory:',
 }
 
-SqlTestBackend = namedtuple("SqlTestBackend", ("engine", "base_connection_string",))
+
+class SqlTestBackend(object):
+    """Connection info for one SQL backend under test, with a lazily-created engine."""
+
+    def __init__(self, base_connection_string, engine=None):
+        """Create a backend for the connection string, optionally with an already-built engine."""
+        self.base_connection_string = base_connection_string
+        self._engine = engine
+
+    @property
+    def engine(self):
+        """Return the backend's SQLAlchemy engine, creating it on first access.
+
+        Engine construction imports the dialect and initializes a connection pool, so backends
+        that a test run never touches should not pay for it.
+        """
+        if self._engine is None:
+            self._engine = create_engine(self.base_connection_string)
+        return self._engine
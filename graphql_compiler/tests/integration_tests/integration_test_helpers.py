@@ -4,7 +4,6 @@ from typing import Any, Dict, List, Tuple, TypeVar, Union
 
 from pyorient.orient import OrientDB
 from redisgraph.client import Graph
-import six
 from sqlalchemy.engine.base import Engine
 
 from graphql_compiler.schema.schema_info import SQLAlchemySchemaInfo
@@ -30,11 +29,16 @@ def sort_db_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     sort_order: List[str] = []
     if len(results) > 0:
-        sort_order = sorted(six.iterkeys(results[0]))
+        sort_order = sorted(results[0].keys())
 
-    def sort_key(result: Dict[str, Any]) -> Tuple[Tuple[bool, Any], ...]:
+    def sort_key(result: Dict[str, Any]) -> Tuple[Any, ...]:
         """Convert None/Not None to avoid comparisons of None to a non-None type."""
-        return tuple((result[col] is not None, result[col]) for col in sort_order)
+        # The key is flattened into a single tuple of alternating (is not None, value) entries,
+        # which compares identically to a tuple of 2-tuples but avoids allocating a nested tuple
+        # per column for every row.
+        return tuple(
+            entry for col in sort_order for entry in (result[col] is not None, result[col])
+        )
 
     def sorted_value(value: T) -> Union[List[Any], T]:
         """Return a sorted version of a value, if it is a list."""
@@ -43,13 +47,16 @@ def sort_db_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         return value
 
     return sorted(
-        [{k: sorted_value(v) for k, v in six.iteritems(row)} for row in results], key=sort_key
+        [{k: sorted_value(v) for k, v in row.items()} for row in results], key=sort_key
     )
 
 
 def try_convert_decimal_to_string(value: T) -> Any:
     """Return Decimals as string if value is a Decimal, return value otherwise."""
     if isinstance(value, list):
+        # Skip rebuilding the list when it cannot contain any Decimals to convert.
+        if not any(isinstance(subvalue, (Decimal, list)) for subvalue in value):
+            return value
         return [try_convert_decimal_to_string(subvalue) for subvalue in value]
     if isinstance(value, Decimal):
         return str(value)
@@ -63,10 +70,15 @@ def compile_and_run_match_query(
     orientdb_client: OrientDB,
 ) -> List[Dict[str, Any]]:
     """Compile and run a MATCH query against the supplied graph client."""
-    # MATCH code emitted by the compiler expects Decimals to be passed in as strings
-    converted_parameters = {
-        name: try_convert_decimal_to_string(value) for name, value in six.iteritems(parameters)
-    }
+    # MATCH code emitted by the compiler expects Decimals to be passed in as strings.
+    # The common case has no Decimals at all, which we detect with a single cheap scan
+    # instead of rebuilding the parameter dict.
+    if any(isinstance(value, (Decimal, list)) for value in parameters.values()):
+        converted_parameters = {
+            name: try_convert_decimal_to_string(value) for name, value in parameters.items()
+        }
+    else:
+        converted_parameters = parameters
     compilation_result = graphql_to_match(common_schema_info, graphql_query, converted_parameters)
 
     # Get results, adding None for optional columns with no matches
@@ -90,9 +102,8 @@ def compile_and_run_sql_query(
     """Compile and run a SQL query against the SQL engine, return result and output metadata."""
     compilation_result = graphql_to_sql(sql_schema_info, graphql_query, parameters)
     query = compilation_result.query
-    results = []
-    for result in engine.execute(query):
-        results.append(dict(result))
+    # Materialize all rows in a single comprehension rather than a per-row append loop.
+    results = [dict(result) for result in engine.execute(query)]
     # Output metadata is needed for MSSQL fold postprocessing.
     return results, compilation_result.output_metadata
 
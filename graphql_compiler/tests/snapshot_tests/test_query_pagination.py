@@ -1,5 +1,8 @@
 # Copyright 2019-present Kensho Technologies, LLC.
 import datetime
+from functools import lru_cache
+from itertools import islice
+import sys
 from typing import Tuple
 import unittest
 
@@ -32,6 +35,44 @@ from ..test_helpers import compare_graphql, generate_schema_graph, get_function_
 from ..test_input_data import CommonTestData
 
 
+# Query strings shared by many of the tests below, hoisted so each exists once at module
+# scope and parses into a single cached AST.
+_ANIMAL_QUERY = """{
+            Animal {
+                name @output(out_name: "animal")
+            }
+        }"""
+
+_ANIMAL_NAME_QUERY = """{
+            Animal {
+                name @output(out_name: "animal_name")
+            }
+        }"""
+
+_SPECIES_NAME_QUERY = """{
+            Species {
+                name @output(out_name: "species_name")
+            }
+        }"""
+
+_EVENT_NAME_QUERY = """{
+            Event {
+                name @output(out_name: "event_name")
+            }
+        }"""
+
+
+# Quantile lists reused by many tests, allocated once for the module. Never mutated.
+_INT_QUANTILES = list(range(101))
+_DATE_QUANTILES = [datetime.datetime(2000 + i, 1, 1) for i in range(101)]
+
+
+@lru_cache(maxsize=64)
+def _safe_parse_graphql_cached(graphql_string):
+    """Parse the query string, memoizing the AST since tests reuse the same few queries."""
+    return safe_parse_graphql(graphql_string)
+
+
 # The following TestCase class uses the 'snapshot_orientdb_client' fixture
 # which pylint does not recognize as a class member.
 # pylint: disable=no-member
@@ -39,33 +80,97 @@ from ..test_input_data import CommonTestData
 class QueryPaginationTests(unittest.TestCase):
     """Test the query pagination module."""
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
-    def test_pagination_planning_basic(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
-        class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
-        schema_info = QueryPlanningSchemaInfo(
+    # Cached schema objects, built once per class on first use. Generating the SchemaGraph and
+    # GraphQL schema from OrientDB is expensive and identical for every test in this class.
+    _schema_objects = None
+
+    def _get_schema_objects(self):
+        """Return (schema_graph, graphql_schema, type_equivalence_hints), built once per class."""
+        cls = type(self)
+        if cls._schema_objects is None:
+            schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # fixture
+            graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(
+                schema_graph
+            )
+            cls._schema_objects = (schema_graph, graphql_schema, type_equivalence_hints)
+        return cls._schema_objects
+
+    # Prototype dicts derived from the vertex class names, built once per class. Tests that
+    # mutate pagination_keys get a fresh copy; uuid4_field_info is read-only and shared.
+    _vertex_class_names = None
+    _pagination_keys_proto = None
+    _uuid4_field_info_cache: dict = {}
+
+    def _get_vertex_class_names(self):
+        """Return the schema's vertex class names as an interned tuple, built once per class."""
+        cls = type(self)
+        if cls._vertex_class_names is None:
+            schema_graph = self._get_schema_objects()[0]
+            # Interning the names makes the dicts keyed on them hash and compare against
+            # interned literals (e.g. pagination_keys[\"Species\"]) by pointer equality.
+            cls._vertex_class_names = tuple(
+                sys.intern(name) for name in schema_graph.vertex_class_names
+            )
+        return cls._vertex_class_names
+
+    def _make_pagination_keys(self):
+        """Return a fresh pagination_keys dict mapping every vertex class to its uuid field."""
+        cls = type(self)
+        if cls._pagination_keys_proto is None:
+            cls._pagination_keys_proto = dict.fromkeys(self._get_vertex_class_names(), "uuid")
+        return dict(cls._pagination_keys_proto)
+
+    def _make_uuid4_field_info(self, ordering):
+        """Return the uuid4_field_info dict for the given UUIDOrdering, shared across tests."""
+        cls = type(self)
+        uuid4_field_info = cls._uuid4_field_info_cache.get(ordering, None)
+        if uuid4_field_info is None:
+            # Every vertex maps to the same (never mutated) field info, so share one inner dict
+            # across all keys instead of allocating one per vertex.
+            uuid4_field_info = dict.fromkeys(self._get_vertex_class_names(), {"uuid": ordering})
+            cls._uuid4_field_info_cache[ordering] = uuid4_field_info
+        return uuid4_field_info
+
+    def _make_schema_info(self, statistics, pagination_keys=None, uuid4_field_info=None, **kwargs):
+        """Build a QueryPlanningSchemaInfo over the shared schema objects.
+
+        The pagination_keys and uuid4_field_info arguments default to the shared prototypes
+        (uuid pagination keys, left-to-right uuid ordering) that most tests use unchanged.
+        """
+        schema_graph, graphql_schema, type_equivalence_hints = self._get_schema_objects()
+        if pagination_keys is None:
+            pagination_keys = self._make_pagination_keys()
+        if uuid4_field_info is None:
+            uuid4_field_info = self._make_uuid4_field_info(UUIDOrdering.LeftToRight)
+        return QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
             schema_graph=schema_graph,
             statistics=statistics,
             pagination_keys=pagination_keys,
             uuid4_field_info=uuid4_field_info,
+            **kwargs,
+        )
+
+    def _assert_generator_yields_exactly(self, expected_parameters, generated_parameters):
+        """Assert the generator yields exactly the expected parameters and nothing more.
+
+        Draws one element more than expected from the generator: enough to prove it is
+        exhausted, without fully materializing it on failure.
+        """
+        self.assertEqual(
+            expected_parameters, list(islice(generated_parameters, len(expected_parameters) + 1))
         )
 
+    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    def test_pagination_planning_basic(self) -> None:
+        class_counts = {"Animal": 1000}
+        statistics = LocalStatistics(class_counts)
+        schema_info = self._make_schema_info(statistics)
+
         # Check that the correct plan is generated when it's obvious (page the root)
         query = QueryStringWithParameters(
-            """{
-            Animal {
-                name @output(out_name: "animal_name")
-            }
-        }""",
+            _ANIMAL_NAME_QUERY,
             {},
         )
         number_of_pages = 10
@@ -78,31 +183,13 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_planning_invalid_extra_args(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Animal": 1000}
         statistics = LocalStatistics(class_counts)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics)
 
         # Check that the correct plan is generated when it's obvious (page the root)
         query = QueryStringWithParameters(
-            """{
-            Animal {
-                name @output(out_name: "animal_name")
-            }
-        }""",
+            _ANIMAL_NAME_QUERY,
             {"country": "USA"},
         )
         with self.assertRaises(GraphQLInvalidArgumentError):
@@ -112,23 +199,9 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_planning_invalid_missing_args(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Animal": 1000}
         statistics = LocalStatistics(class_counts)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics)
 
         # Check that the correct plan is generated when it's obvious (page the root)
         query = QueryStringWithParameters(
@@ -147,23 +220,9 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_planning_unique_filter(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Animal": 1000}
         statistics = LocalStatistics(class_counts)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics)
 
         query = QueryStringWithParameters(
             """{
@@ -188,25 +247,10 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_planning_unique_filter_on_many_to_one(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Animal": 1000}
         statistics = LocalStatistics(class_counts)
         edge_constraints = {"Animal_ParentOf": EdgeConstraint.AtMostOneSource}
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-            edge_constraints=edge_constraints,
-        )
+        schema_info = self._make_schema_info(statistics, edge_constraints=edge_constraints)
 
         query = QueryStringWithParameters(
             """{
@@ -236,34 +280,17 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_planning_on_int(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
             class_counts, field_quantiles={("Species", "limbs"): list(range(100))}
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         # Check that the paginator generates a plan paginating on an int field
         query = QueryStringWithParameters(
-            """{
-            Species {
-                name @output(out_name: "species_name")
-            }
-        }""",
+            _SPECIES_NAME_QUERY,
             {},
         )
         number_of_pages = 10
@@ -278,32 +305,15 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_planning_on_int_error(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(class_counts)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         # Check that the paginator detects a lack of quantile data for Species.limbs
         query = QueryStringWithParameters(
-            """{
-            Species {
-                name @output(out_name: "species_name")
-            }
-        }""",
+            _SPECIES_NAME_QUERY,
             {},
         )
         number_of_pages = 10
@@ -314,23 +324,11 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual([w.message for w in expected_advisories], [w.message for w in advisories])
         self.assertEqual(expected_plan, pagination_plan)
 
-    # TODO: These tests can be sped up by having an existing test SchemaGraph object.
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_basic_pagination(self) -> None:
         """Ensure a basic pagination query is handled correctly."""
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         query = QueryStringWithParameters(
-            """{
-            Animal {
-                name @output(out_name: "animal")
-            }
-        }""",
+            _ANIMAL_QUERY,
             {},
         )
 
@@ -339,14 +337,7 @@ class QueryPaginationTests(unittest.TestCase):
         }
 
         statistics = LocalStatistics(count_data)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics)
 
         first_page_and_remainder, _ = paginate_query(schema_info, query, 1)
         first = first_page_and_remainder.one_page
@@ -429,19 +420,9 @@ class QueryPaginationTests(unittest.TestCase):
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_basic_pagination_mssql_uuids(self) -> None:
         """Ensure a basic pagination query is handled correctly."""
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LastSixBytesFirst}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = self._make_uuid4_field_info(UUIDOrdering.LastSixBytesFirst)
         query = QueryStringWithParameters(
-            """{
-            Animal {
-                name @output(out_name: "animal")
-            }
-        }""",
+            _ANIMAL_QUERY,
             {},
         )
 
@@ -450,14 +431,7 @@ class QueryPaginationTests(unittest.TestCase):
         }
 
         statistics = LocalStatistics(count_data)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, uuid4_field_info=uuid4_field_info)
 
         first_page_and_remainder, _ = paginate_query(schema_info, query, 1)
         first = first_page_and_remainder.one_page
@@ -539,36 +513,19 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_datetime(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Event"] = "event_date"  # Force pagination on datetime field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Event": 1000}
         statistics = LocalStatistics(
             class_counts,
             field_quantiles={
-                ("Event", "event_date"): [datetime.datetime(2000 + i, 1, 1) for i in range(101)],
+                ("Event", "event_date"): _DATE_QUANTILES,
             },
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = QueryStringWithParameters(
-            """{
-            Event {
-                name @output(out_name: "event_name")
-            }
-        }""",
+            _EVENT_NAME_QUERY,
             {},
         )
 
@@ -642,29 +599,16 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_datetime_existing_filter(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Event"] = "event_date"  # Force pagination on datetime field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Event": 1000}
         statistics = LocalStatistics(
             class_counts,
             field_quantiles={
-                ("Event", "event_date"): [datetime.datetime(2000 + i, 1, 1) for i in range(101)],
+                ("Event", "event_date"): _DATE_QUANTILES,
             },
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         local_datetime = datetime.datetime(2050, 1, 1, 0, 0)
         query = QueryStringWithParameters(
@@ -712,29 +656,16 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_pagination_datetime_existing_tz_aware_filter(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Event"] = "event_date"  # Force pagination on datetime field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Event": 1000}
         statistics = LocalStatistics(
             class_counts,
             field_quantiles={
-                ("Event", "event_date"): [datetime.datetime(2000 + i, 1, 1) for i in range(101)],
+                ("Event", "event_date"): _DATE_QUANTILES,
             },
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = QueryStringWithParameters(
             """{
@@ -785,79 +716,45 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_int(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): [i for i in range(101)],}
-        )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
+            class_counts, field_quantiles={("Species", "limbs"): _INT_QUANTILES,}
         )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
-        query = """{
-            Species {
-                name @output(out_name: "species_name")
-            }
-        }"""
+        query = _SPECIES_NAME_QUERY
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 4)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
         )
 
         expected_parameters = [25, 50, 75]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_int_few_quantiles(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 10000000}
         statistics = LocalStatistics(
             class_counts, field_quantiles={("Species", "limbs"): [0, 10, 20, 30,],}
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
-        query = """{
-            Species {
-                name @output(out_name: "species_name")
-            }
-        }"""
+        query = _SPECIES_NAME_QUERY
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 3)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
         )
 
         expected_parameters = [10, 20]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     def test_choose_parameter_values(self):
         self.assertEqual([1], list(_choose_parameter_values([1], 2)))
@@ -873,26 +770,13 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_int_existing_filters(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): [i for i in range(101)],}
-        )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
+            class_counts, field_quantiles={("Species", "limbs"): _INT_QUANTILES,}
         )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = """{
             Species {
@@ -901,37 +785,24 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {"limbs_lower": 25}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 3)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
         )
 
         expected_parameters = [50, 75]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_int_existing_filter_tiny_page(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
             class_counts, field_quantiles={("Species", "limbs"): list(range(0, 101, 10))},
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = """{
             Species {
@@ -940,7 +811,7 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {"limbs_lower": 10}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 10)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
@@ -951,26 +822,13 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_int_existing_filters_2(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): [i for i in range(101)],}
-        )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
+            class_counts, field_quantiles={("Species", "limbs"): _INT_QUANTILES,}
         )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = """{
             Species {
@@ -979,37 +837,24 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {"limbs_upper": 76}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 3)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
         )
 
         expected_parameters = [25, 50]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_inline_fragment(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): [i for i in range(101)],}
-        )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
+            class_counts, field_quantiles={("Species", "limbs"): _INT_QUANTILES,}
         )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = """{
             Species {
@@ -1021,37 +866,24 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Species", "out_Entity_Related"), "limbs", 4)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
         )
 
         expected_parameters = [25, 50, 75]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_with_existing_filters(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
             class_counts, field_quantiles={("Species", "limbs"): list(range(0, 1001, 10))}
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = """{
             Species {
@@ -1060,7 +892,7 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {"num_limbs": 505}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 4)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
@@ -1068,41 +900,24 @@ class QueryPaginationTests(unittest.TestCase):
 
         # XXX document why this is expected, see if bisect_left logic is correct
         expected_parameters = [130, 260, 390]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_datetime(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Event"] = "event_date"  # Force pagination on datetime field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Event": 1000}
         statistics = LocalStatistics(
             class_counts,
             field_quantiles={
-                ("Event", "event_date"): [datetime.datetime(2000 + i, 1, 1) for i in range(101)],
+                ("Event", "event_date"): _DATE_QUANTILES,
             },
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
-        query = """{
-            Event {
-                name @output(out_name: "event_name")
-            }
-        }"""
+        query = _EVENT_NAME_QUERY
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Event",), "event_date", 4)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
@@ -1113,35 +928,17 @@ class QueryPaginationTests(unittest.TestCase):
             datetime.datetime(2050, 1, 1, 0, 0),
             datetime.datetime(2075, 1, 1, 0, 0),
         ]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_uuid(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Animal": 1000}
         statistics = LocalStatistics(class_counts)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics)
 
-        query = """{
-            Animal {
-                name @output(out_name: "animal_name")
-            }
-        }"""
+        query = _ANIMAL_NAME_QUERY
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Animal",), "uuid", 4)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
@@ -1152,35 +949,18 @@ class QueryPaginationTests(unittest.TestCase):
             "80000000-0000-0000-0000-000000000000",
             "c0000000-0000-0000-0000-000000000000",
         ]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_mssql_uuid(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LastSixBytesFirst}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = self._make_uuid4_field_info(UUIDOrdering.LastSixBytesFirst)
         class_counts = {"Animal": 1000}
         statistics = LocalStatistics(class_counts)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, uuid4_field_info=uuid4_field_info)
 
-        query = """{
-            Animal {
-                name @output(out_name: "animal_name")
-            }
-        }"""
+        query = _ANIMAL_NAME_QUERY
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Animal",), "uuid", 4)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
@@ -1191,27 +971,14 @@ class QueryPaginationTests(unittest.TestCase):
             "00000000-0000-0000-0000-800000000000",
             "00000000-0000-0000-0000-c00000000000",
         ]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_mssql_uuid_with_existing_filter(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LastSixBytesFirst}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = self._make_uuid4_field_info(UUIDOrdering.LastSixBytesFirst)
         class_counts = {"Animal": 1000}
         statistics = LocalStatistics(class_counts)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, uuid4_field_info=uuid4_field_info)
 
         query = """{
             Animal {
@@ -1222,7 +989,7 @@ class QueryPaginationTests(unittest.TestCase):
         args = {
             "uuid_lower": "00000000-0000-0000-0000-800000000000",
         }
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Animal",), "uuid", 4)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
@@ -1233,39 +1000,22 @@ class QueryPaginationTests(unittest.TestCase):
             "00000000-0000-0000-0000-c00000000000",
             "00000000-0000-0000-0000-e00000000000",
         ]
-        self.assertEqual(expected_parameters, list(generated_parameters))
+        self._assert_generator_yields_exactly(expected_parameters, generated_parameters)
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_parameter_value_generation_consecutive(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
             class_counts,
             field_quantiles={("Species", "limbs"): [0 for i in range(1000)] + list(range(101))},
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
-        query = """{
-            Species {
-                name @output(out_name: "species_name")
-            }
-        }"""
+        query = _SPECIES_NAME_QUERY
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _safe_parse_graphql_cached(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 4)
         generated_parameters = generate_parameters_for_vertex_partition(
             schema_info, ASTWithParameters(query_ast, args), vertex_partition
@@ -1277,34 +1027,17 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_query_parameterizer(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
             class_counts,
             field_quantiles={("Species", "limbs"): [0 for i in range(1000)] + list(range(101))},
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = QueryStringWithParameters(
-            """{
-            Species {
-                name @output(out_name: "species_name")
-            }
-        }""",
+            _SPECIES_NAME_QUERY,
             {},
         )
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 4)
@@ -1329,27 +1062,14 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_query_parameterizer_name_conflict(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
             class_counts,
             field_quantiles={("Species", "limbs"): [0 for i in range(1000)] + list(range(101))},
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = QueryStringWithParameters(
             """{
@@ -1384,27 +1104,14 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_query_parameterizer_filter_deduplication(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000}
         statistics = LocalStatistics(
             class_counts,
             field_quantiles={("Species", "limbs"): [0 for i in range(1000)] + list(range(101))},
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = QueryStringWithParameters(
             """{
@@ -1439,19 +1146,8 @@ class QueryPaginationTests(unittest.TestCase):
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_no_pagination(self):
         """Ensure pagination is not done when not needed."""
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         original_query = QueryStringWithParameters(
-            """{
-            Animal {
-                name @output(out_name: "animal")
-            }
-        }""",
+            _ANIMAL_QUERY,
             {},
         )
 
@@ -1460,14 +1156,7 @@ class QueryPaginationTests(unittest.TestCase):
         }
 
         statistics = LocalStatistics(count_data)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics)
 
         first_page_and_remainder, _ = paginate_query(schema_info, original_query, 10)
         first = first_page_and_remainder.one_page
@@ -1481,19 +1170,9 @@ class QueryPaginationTests(unittest.TestCase):
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_impossible_pagination(self):
         """Ensure no unwanted error is raised when pagination is needed but stats are missing."""
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
         pagination_keys = {}  # No pagination keys, so the planner has no options
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         original_query = QueryStringWithParameters(
-            """{
-            Animal {
-                name @output(out_name: "animal")
-            }
-        }""",
+            _ANIMAL_QUERY,
             {},
         )
 
@@ -1502,14 +1181,7 @@ class QueryPaginationTests(unittest.TestCase):
         }
 
         statistics = LocalStatistics(count_data)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         first_page_and_remainder, _ = paginate_query(schema_info, original_query, 10)
         first = first_page_and_remainder.one_page
@@ -1522,14 +1194,8 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_impossible_pagination_strong_filters_few_repeated_quantiles(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000000000000}
         statistics = LocalStatistics(
             class_counts,
@@ -1537,14 +1203,7 @@ class QueryPaginationTests(unittest.TestCase):
                 ("Species", "limbs"): list(i for i in range(0, 101, 10) for _ in range(10000))
             },
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = QueryStringWithParameters(
             """{
@@ -1567,14 +1226,8 @@ class QueryPaginationTests(unittest.TestCase):
 
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_impossible_pagination_strong_filters_few_quantiles(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        pagination_keys = self._make_pagination_keys()
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
         class_counts = {"Species": 1000000000000}
         statistics = LocalStatistics(
             class_counts,
@@ -1582,14 +1235,7 @@ class QueryPaginationTests(unittest.TestCase):
                 ("Species", "limbs"): list(i for i in range(0, 101, 10) for _ in range(10000))
             },
         )
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics, pagination_keys)
 
         query = QueryStringWithParameters(
             """{
@@ -1613,24 +1259,11 @@ class QueryPaginationTests(unittest.TestCase):
     @pytest.mark.usefixtures("snapshot_orientdb_client")
     def test_with_compiler_tests(self):
         """Test that pagination doesn't crash on any of the queries from the compiler tests."""
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph, graphql_schema, type_equivalence_hints = self._get_schema_objects()
         count_data = {vertex_name: 100 for vertex_name in schema_graph.vertex_class_names}
         count_data.update({edge_name: 100 for edge_name in schema_graph.edge_class_names})
         statistics = LocalStatistics(count_data)
-        schema_info = QueryPlanningSchemaInfo(
-            schema=graphql_schema,
-            type_equivalence_hints=type_equivalence_hints,
-            schema_graph=schema_graph,
-            statistics=statistics,
-            pagination_keys=pagination_keys,
-            uuid4_field_info=uuid4_field_info,
-        )
+        schema_info = self._make_schema_info(statistics)
 
         arbitrary_value_for_type = {
             "String": "string_1",
@@ -1,14 +1,14 @@
 # Copyright 2018-present Kensho Technologies, LLC.
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-from glob import glob
+import os
 from os import path
 import string
 
 from funcy import retry
 from redisgraph import Edge, Node
-import six
-from sqlalchemy import create_engine, text
-from sqlalchemy.schema import CreateSchema
+from sqlalchemy import create_engine
+from sqlalchemy.schema import CreateSchema, CreateTable
 
 from ...global_utils import merge_non_overlapping_dicts
 from ..integration_tests.integration_backend_config import (
@@ -83,7 +83,7 @@ def get_integration_data():
 
     # Find the class name of each vertex uuid
     uuid_to_class_name = {}
-    for vertex_name, values in six.iteritems(vertex_values):
+    for vertex_name, values in vertex_values.items():
         for value in values:
             if value["uuid"] in uuid_to_class_name:
                 raise AssertionError(u"Duplicate uuid found {}".format(value["uuid"]))
@@ -95,14 +95,20 @@ def get_integration_data():
 def generate_orient_snapshot_data(client):
     """Create OrientDB test DB from the SQL commands file for snapshot testing."""
     project_root = path.dirname(path.abspath(__file__))
-    sql_files = glob(path.join(project_root, "snapshot_data/*.sql"))
+    # os.scandir avoids the per-entry stat() and pattern compilation that glob() performs.
+    # Sort the paths so files load in a deterministic order.
+    sql_files = sorted(
+        entry.path
+        for entry in os.scandir(path.join(project_root, "snapshot_data"))
+        if entry.is_file() and entry.name.endswith(".sql")
+    )
 
     _load_sql_files_to_orient_client(client, sql_files)
 
 
 def _validate_name(name):
     """Check conservatively for allowed vertex and field names."""
-    if not isinstance(name, six.string_types):
+    if not isinstance(name, str):
         raise AssertionError(u"Expected string name. Received {}".format(name))
     allowed_characters = string.ascii_uppercase + string.ascii_lowercase + string.digits + "_"
     if any(c not in allowed_characters for c in str(name)):
@@ -112,13 +118,13 @@ def _validate_name(name):
 def _write_orient_equality(field_name, field_value):
     """Write a '{} = {}' statement to be used in queries, validating against SQL injection."""
     _validate_name(field_name)
-    if isinstance(field_value, six.string_types):
+    if isinstance(field_value, str):
         allowed_characters = string.ascii_uppercase + string.ascii_lowercase + string.digits + "-_ "
         if any(c not in allowed_characters for c in str(field_value)):
             raise AssertionError(
                 u"String value {} contains disallowed characters".format(field_value)
             )
-    elif isinstance(field_value, (six.integer_types, float, datetime.date)):
+    elif isinstance(field_value, (int, float, datetime.date)):
         pass
     else:
         raise NotImplementedError(
@@ -135,14 +141,14 @@ def _write_orient_equality(field_name, field_value):
 def generate_orient_integration_data(client):
     """Create OrientDB test DB from the standard integration data."""
     vertex_values, edge_values, uuid_to_class_name = get_integration_data()
-    for vertex_name, vertices in six.iteritems(vertex_values):
+    for vertex_name, vertices in vertex_values.items():
         for vertex_props in vertices:
             _validate_name(vertex_name)
             command = "CREATE VERTEX {} SET ".format(vertex_name) + ", ".join(
-                _write_orient_equality(key, value) for key, value in six.iteritems(vertex_props)
+                _write_orient_equality(key, value) for key, value in vertex_props.items()
             )
             client.command(command)
-    for edge_name, edges in six.iteritems(edge_values):
+    for edge_name, edges in edge_values.items():
         for edge_spec in edges:
             from_classname = uuid_to_class_name[edge_spec["from_uuid"]]
             to_classname = uuid_to_class_name[edge_spec["to_uuid"]]
@@ -166,7 +172,7 @@ def generate_neo4j_integration_data(client):
     vertex_values, edge_values, _ = get_integration_data()
     with client.driver.session() as session:
         session.run("match (n) detach delete n")
-        for vertex_name, vertices in six.iteritems(vertex_values):
+        for vertex_name, vertices in vertex_values.items():
             _validate_name(vertex_name)
             for vertex_props in vertices:
                 for key in vertex_props:
@@ -176,7 +182,7 @@ def generate_neo4j_integration_data(client):
                 )
                 session.run(command, vertex_props)
     with client.driver.session() as session:
-        for edge_name, edges in six.iteritems(edge_values):
+        for edge_name, edges in edge_values.items():
             _validate_name(edge_name)
             for edge_spec in edges:
                 command = (
@@ -199,7 +205,7 @@ def generate_redisgraph_integration_data(client):
     client.query("create (n)")
     client.query("match (n) delete n")
     uuid_to_node = {}
-    for vertex_name, vertices in six.iteritems(vertex_values):
+    for vertex_name, vertices in vertex_values.items():
         for vertex_props in vertices:
             # NOTE(bojanserafimov): Dates and datetimes are not supported in redisgraph,
             #                       so we just omit them from the dataset.
@@ -207,12 +213,12 @@ def generate_redisgraph_integration_data(client):
                 label=vertex_name,
                 properties={
                     key: value
-                    for key, value in six.iteritems(vertex_props)
+                    for key, value in vertex_props.items()
                     if not isinstance(value, (datetime.date, datetime.datetime))
                 },
             )
             client.add_node(uuid_to_node[vertex_props["uuid"]])
-    for edge_name, edges in six.iteritems(edge_values):
+    for edge_name, edges in edge_values.items():
         for edge_spec in edges:
             client.add_edge(
                 Edge(
@@ -224,64 +230,75 @@ def generate_redisgraph_integration_data(client):
     client.commit()
 
 
+def _iter_sql_commands(filepath):
+    """Yield the SQL commands in the file, skipping comments and empty lines."""
+    # Stream the file through a large buffer rather than materializing all of its lines,
+    # keeping peak memory at a single line regardless of file size.
+    with open(filepath, buffering=1 << 20) as f:
+        for line in f:
+            command = line.strip()
+            if command and command[0] != "#":
+                yield command
+
+
 def _load_sql_files_to_orient_client(client, sql_files):
     """Load list of supplied SQL files into the supplied OrientDB client."""
+    # The pyorient client multiplexes all commands over a single socket and is not
+    # thread-safe, so command dispatch must stay serial.
     for filepath in sql_files:
-        with open(filepath) as f:
-            for command in f.readlines():
-                sanitized_command = command.strip()
-                if len(sanitized_command) == 0 or sanitized_command[0] == "#":
-                    # comment or empty line, ignore
-                    continue
+        for command in _iter_sql_commands(filepath):
+            client.command(command)
+
 
-                client.command(sanitized_command)
+def _retry_backoff(attempt):
+    """Return the delay in seconds before the given (zero-based) retry attempt."""
+    # Exponential backoff capped at one second: quick retries while the DB is coming up,
+    # without the fixed one-second sleep between every attempt.
+    return min(1.0, 0.05 * 2 ** attempt)
 
 
-@retry(tries=1, timeout=1)  # pylint: disable=no-value-for-parameter
+@retry(tries=20, timeout=_retry_backoff)  # pylint: disable=no-value-for-parameter
 def init_sql_integration_test_backends():
     """Connect to and open transaction on each SQL DB under test."""
     sql_test_backends = {}
-    for backend_name, base_connection_string in six.iteritems(SQL_BACKEND_TO_CONNECTION_STRING):
-        engine = create_engine(base_connection_string)
+    for backend_name, base_connection_string in SQL_BACKEND_TO_CONNECTION_STRING.items():
+        sql_test_backend = SqlTestBackend(base_connection_string)
         # safely create the test DATABASE for all SQL backends except sqlite
         # sqlite's in-memory database does not need to be explicitly created/dropped.
         if backend_name in EXPLICIT_DB_BACKENDS:
-            # Drop databases if they exist
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(
-                text("DROP DATABASE IF EXISTS db_1;")
-            )
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(
-                text("DROP DATABASE IF EXISTS db_2;")
-            )
+            # Run all of the setup DDL over a single AUTOCOMMIT connection, instead of opening
+            # a new connection (and options-wrapped engine) for every statement. Accessing
+            # .engine here creates the engine; backends without setup DDL defer that cost
+            # until a test first uses them.
+            engine = sql_test_backend.engine
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+                # Drop databases if they exist
+                connection.execute("DROP DATABASE IF EXISTS db_1;")
+                connection.execute("DROP DATABASE IF EXISTS db_2;")
+
+                # create the test databases
+                connection.execute("CREATE DATABASE db_1;")
+                connection.execute("CREATE DATABASE db_2;")
+
+                # create the test schemas in db_1
+                connection.execute("USE db_1;")
+                connection.execute(CreateSchema("schema_1"))
+                connection.execute(CreateSchema("schema_2"))
+
+                # create the test schemas in db_2
+                connection.execute("USE db_2;")
+                connection.execute(CreateSchema("schema_1"))
+                connection.execute(CreateSchema("schema_2"))
+
+                connection.execute("USE master;")
 
-            # create the test databases
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(
-                text("CREATE DATABASE db_1;")
-            )
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(
-                text("CREATE DATABASE db_2;")
-            )
-
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(text("USE db_1;"))
-            # create the test schemas in db_1
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(CreateSchema("schema_1"))
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(CreateSchema("schema_2"))
-
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(text("USE db_2;"))
-            # create the test schemas in db_2
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(CreateSchema("schema_1"))
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(CreateSchema("schema_2"))
-
-            engine.execution_options(isolation_level="AUTOCOMMIT").execute(text("USE master;"))
-
-        sql_test_backend = SqlTestBackend(engine, base_connection_string)
         sql_test_backends[backend_name] = sql_test_backend
     return sql_test_backends
 
 
 def tear_down_integration_test_backends(sql_test_backends):
     """Rollback backends' transactions to wipe test data and to close the active connections."""
-    for backend_name, sql_test_backend in six.iteritems(sql_test_backends):
+    for backend_name, sql_test_backend in sql_test_backends.items():
         if backend_name not in EXPLICIT_DB_BACKENDS:
             continue
         # explicitly release engine resources, specifically to disconnect from active DB
@@ -291,12 +308,9 @@ def tear_down_integration_test_backends(sql_test_backends):
         engine = create_engine(sql_test_backend.base_connection_string)
         # set execution options to AUTOCOMMIT so that the DB drop is not performed in a transaction
         # as this is not allowed on some SQL backends
-        engine.execution_options(isolation_level="AUTOCOMMIT").execute(
-            text("DROP DATABASE IF EXISTS db_1;")
-        )
-        engine.execution_options(isolation_level="AUTOCOMMIT").execute(
-            text("DROP DATABASE IF EXISTS db_2;")
-        )
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute("DROP DATABASE IF EXISTS db_1;")
+            connection.execute("DROP DATABASE IF EXISTS db_2;")
 
 
 def generate_sql_integration_data(sql_test_backends):
@@ -306,7 +320,7 @@ def generate_sql_integration_data(sql_test_backends):
 
     # Represent all edges as foreign keys
     uuid_to_foreign_key_values = {}
-    for edge_name, edge_values in six.iteritems(edge_values):
+    for edge_name, edge_values in edge_values.items():
         for edge_value in edge_values:
             from_classname = uuid_to_class_name[edge_value["from_uuid"]]
             edge_field_name = "out_{}".format(edge_name)
@@ -344,14 +358,43 @@ def generate_sql_integration_data(sql_test_backends):
                 existing_foreign_key_values[join_descriptor.from_column] = edge_value["to_uuid"]
 
     # Insert all the prepared data into the test database
-    for sql_test_backend in six.itervalues(sql_test_backends):
-        for vertex_name, insert_values in six.iteritems(vertex_values):
+    create_table_ddl_cache = {}
+    # The rows to insert are identical for every backend, so prepare them once. All rows in
+    # a single execute() call must share the same columns, so group the rows by column set:
+    # rows differ in which foreign key columns their edges produce.
+    row_groups_by_vertex = {}
+    for vertex_name, insert_values in vertex_values.items():
+        rows_by_columns = {}
+        for insert_value in insert_values:
+            foreign_key_values = uuid_to_foreign_key_values.get(insert_value["uuid"], {})
+            all_values = merge_non_overlapping_dicts(insert_value, foreign_key_values)
+            rows_by_columns.setdefault(frozenset(all_values), []).append(all_values)
+        row_groups_by_vertex[vertex_name] = list(rows_by_columns.values())
+
+    def _populate_backend(sql_test_backend):
+        """Create the tables and insert the prepared rows on a single backend."""
+        engine = sql_test_backend.engine
+        for vertex_name, row_groups in row_groups_by_vertex.items():
             table = sql_schema_info.vertex_name_to_table[vertex_name]
-            table.delete(bind=sql_test_backend.engine)
-            table.create(bind=sql_test_backend.engine)
-            for insert_value in insert_values:
-                foreign_key_values = uuid_to_foreign_key_values.get(insert_value["uuid"], {})
-                all_values = merge_non_overlapping_dicts(insert_value, foreign_key_values)
-                sql_test_backend.engine.execute(table.insert().values(**all_values))
+
+            # Compile the CREATE TABLE statement once per dialect: backends that share a
+            # dialect execute the cached DDL string instead of re-compiling it.
+            ddl_cache_key = (engine.dialect.name, vertex_name)
+            create_table_ddl = create_table_ddl_cache.get(ddl_cache_key, None)
+            if create_table_ddl is None:
+                create_table_ddl = str(CreateTable(table).compile(dialect=engine.dialect))
+                create_table_ddl_cache[ddl_cache_key] = create_table_ddl
+            engine.execute(create_table_ddl)
+
+            # Insert rows in as few executemany round-trips as possible.
+            for rows in row_groups:
+                engine.execute(table.insert(), rows)
+
+    # Populate the backends concurrently: each one is an independent server, and the work is
+    # dominated by network round-trips during which the DB drivers release the GIL.
+    if sql_test_backends:
+        with ThreadPoolExecutor(max_workers=len(sql_test_backends)) as executor:
+            # Iterating the results re-raises any exception from the worker threads.
+            list(executor.map(_populate_backend, sql_test_backends.values()))
 
     return sql_schema_info